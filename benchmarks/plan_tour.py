@@ -0,0 +1,46 @@
+# Benchmark: Parallel Tour Planning
+
+# Times plan_tour on a large random map with a growing number of worker processes and prints the speed-up over
+# a single worker. Run it from the repository root: python benchmarks/plan_tour.py [stops] [grid size]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smart_delivery.environment import Environment
+from smart_delivery.tour import compile_map, plan_tour
+
+
+def build_tour(stops, N, seed=0):
+    rng = random.Random(seed)
+    obstacles = {(rng.randint(1, N), rng.randint(1, N)) for _ in range(N * N // 10)} - {(1, 1)}
+    points = set()
+    while len(points) < stops:
+        cell = (rng.randint(1, N), rng.randint(1, N))
+        if cell not in obstacles:
+            points.add(cell)
+    # A random visiting order gives long legs, so each leg is a substantial A* search.
+    tour = list(points)
+    rng.shuffle(tour)
+    return compile_map(Environment(N, points, obstacles)), tour
+
+def main():
+    stops = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    N = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    compiled, tour = build_tour(stops, N)
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    print(f"{stops} stops on a {N}x{N} grid, {cpus} CPU(s)")
+    baseline = None
+    for workers in counts:
+        start = time.perf_counter()
+        plan_tour((1, 1), tour, compiled, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers}: {elapsed:.2f}s, speed-up {baseline / elapsed:.2f}x")
+
+if __name__ == "__main__":
+    main()
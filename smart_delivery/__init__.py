@@ -0,0 +1,50 @@
+# Smart Delivery Robot
+
+# The shared core behind the task scripts: one environment model (environment), one planner registry
+# (planning), one robot engine (robot), plus the delivery index, tour planning, checkpoints and text rendering
+# they use. Names are loaded lazily on first access, so "import smart_delivery" is cheap and features such as
+# the process pool used for tour planning are only imported by code that actually uses them.
+
+import importlib
+
+_EXPORTS = {
+    "Environment": "environment",
+    "generate_environment": "environment",
+    "generate_delivery_points": "environment",
+    "generate_obstacles": "environment",
+    "generate_no_entry_zones": "environment",
+    "generate_one_way_streets": "environment",
+    "get_grid_size": "environment",
+    "get_starting_position": "environment",
+    "PLANNERS": "planning",
+    "register_planner": "planning",
+    "get_planner": "planning",
+    "heuristic": "planning",
+    "a_star_search": "planning",
+    "manhattan_path": "planning",
+    "SmartDeliveryRobot": "robot",
+    "DeliveryIndex": "spatial_index",
+    "Checkpointer": "checkpoint",
+    "restore": "checkpoint",
+    "count_snapshots": "checkpoint",
+    "CompiledMap": "tour",
+    "compile_map": "tour",
+    "order_tour": "tour",
+    "plan_tour": "tour",
+    "stitch_route": "tour",
+    "display_grid": "render",
+    "format_grid": "render",
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,234 @@
+# Simulation Checkpoints
+
+# A long simulated shift can be snapshotted and restored so that it survives a crash, can be paused and resumed,
+# or can be forked into what-if scenarios from a mid-shift state. A Checkpointer appends snapshots of a robot to
+# a binary file. The first snapshot it writes is a full record of the simulation state (robot position, pending
+# points, delivery history, the map and its version, the planner, the remaining planned legs and the stops they
+# leave out as unreachable); after that each snapshot only records what changed since the previous one. Every
+# few snapshots a full record is written again, and a restore starts from the last full record before the
+# requested snapshot, so it never has to replay too many deltas.
+
+# File layout: a 5-byte header (b"SDRC" followed by the format version), then a sequence of records. Each record
+# is an 11-byte frame (b"SR", kind, payload length, CRC-32 of the payload) followed by the payload: the record's
+# fields as zlib-compressed JSON. JSON only holds plain data, so loading a checkpoint never runs code from the
+# file. A record cut short by a crash is ignored on restore and cut off when a Checkpointer reopens the file,
+# so the file is always usable up to its last complete snapshot; a header torn by a crash is written again. A
+# record whose magic or checksum does not match means the file is corrupt, and raises ValueError rather than
+# being decoded. Only frame headers are read to find the records, so a restore reads and checks the payloads
+# of the records it replays and nothing else.
+
+import json
+import os
+import struct
+import zlib
+
+from .environment import Environment
+from .robot import SmartDeliveryRobot
+
+MAGIC = b"SDRC"
+RECORD_MAGIC = b"SR"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct(">4sB")
+_FRAME = struct.Struct(">2sBII")
+
+FULL = 0
+DELTA = 1
+
+
+class Checkpointer:
+    def __init__(self, path, full_every=100):
+        self.path = path
+        self.full_every = full_every
+        self.snapshots_since_full = None  # None until the first (full) snapshot has been written
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size < _HEADER.size:
+            # A new file, or one whose header was torn by a crash before any record was written.
+            if size:
+                with open(path, "rb") as f:
+                    if not header.startswith(f.read()):
+                        raise ValueError(f"{path} is not a checkpoint file.")
+            with open(path, "wb") as f:
+                f.write(header)
+        else:
+            # Cut off a record left incomplete by a crash, so new records start on a frame boundary.
+            frames = _scan_frames(path)
+            end = frames[-1][1] + frames[-1][2] if frames else _HEADER.size
+            if end < size:
+                with open(path, "r+b") as f:
+                    f.truncate(end)
+        # What the last snapshot recorded, used to work out the next delta.
+        self._map_version = None
+        self._planner = None
+        self._history_length = 0
+        self._pending_count = 0
+        self._plan = None
+        self._plan_length = 0
+        self._plan_version = None
+        self._unreachable = None
+
+    def snapshot(self, robot):
+        """Append a snapshot of the robot's simulation state to the checkpoint file."""
+        if self.snapshots_since_full is None or self.snapshots_since_full >= self.full_every or self._needs_full(robot):
+            kind, record = FULL, self._full_record(robot)
+            self.snapshots_since_full = 0
+        else:
+            kind, record = DELTA, self._delta_record(robot)
+            self.snapshots_since_full += 1
+        self._remember(robot)
+
+        payload = zlib.compress(json.dumps(record, separators=(",", ":")).encode())
+        with open(self.path, "ab") as f:
+            f.write(_FRAME.pack(RECORD_MAGIC, kind, len(payload), zlib.crc32(payload)))
+            f.write(payload)
+
+    def _needs_full(self, robot):
+        # Deltas only describe deliveries. Anything else touching the pending set needs a full record.
+        delivered = len(robot.delivery_history) - self._history_length
+        if delivered < 0 or len(robot.delivery_points) != self._pending_count - delivered:
+            return True
+        return robot.planner_name != self._planner
+
+    def _full_record(self, robot):
+        environment = robot.environment
+        return {
+            "position": (robot.x, robot.y),
+            "pending": list(robot.delivery_points),
+            "history": robot.delivery_history,
+            "map": _map_state(environment),
+            "planner": robot.planner_name,
+            "plan": list(robot.planned_paths),
+            "plan_version": robot.planned_version,
+            "unreachable": list(robot.unreachable_points),
+        }
+
+    def _delta_record(self, robot):
+        record = {
+            "position": (robot.x, robot.y),
+            "history": robot.delivery_history[self._history_length:],
+        }
+        if robot.environment.version != self._map_version:
+            record["map"] = _map_state(robot.environment)
+        # run_planned only ever drops legs from the front of its plan, so an unchanged plan that has got shorter
+        # can be recorded as the number of legs dropped.
+        plan = robot.planned_paths
+        if (plan is self._plan and robot.planned_version == self._plan_version and len(plan) <= self._plan_length
+                and robot.unreachable_points is self._unreachable):
+            record["plan_dropped"] = self._plan_length - len(plan)
+        else:
+            record["plan"] = list(plan)
+            record["plan_version"] = robot.planned_version
+            record["unreachable"] = list(robot.unreachable_points)
+        return record
+
+    def _remember(self, robot):
+        self._map_version = robot.environment.version
+        self._planner = robot.planner_name
+        self._history_length = len(robot.delivery_history)
+        self._pending_count = len(robot.delivery_points)
+        self._plan = robot.planned_paths
+        self._plan_length = len(robot.planned_paths)
+        self._plan_version = robot.planned_version
+        self._unreachable = robot.unreachable_points
+
+def _map_state(environment):
+    # JSON objects only have string keys, so one-way streets are stored as [x, y, direction] triples.
+    one_way_streets = [(x, y, d) for (x, y), d in environment.one_way_streets.items()]
+    return (environment.grid_size, list(environment.obstacles), list(environment.no_entry_zones),
+            one_way_streets, environment.version)
+
+def _cells(cells):
+    """Turn decoded [x, y] lists back into coordinate tuples."""
+    return [tuple(cell) for cell in cells]
+
+def _scan_frames(path):
+    """
+    Return the complete records in the file as (kind, payload offset, payload length, checksum), reading only
+    the frame headers. Stops quietly at a record cut short by a crash; raises ValueError on a corrupt header.
+    """
+    size = os.path.getsize(path)
+    frames = []
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{path} is not a checkpoint file.")
+        magic, version = _HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a checkpoint file (format version {FORMAT_VERSION}).")
+        offset = _HEADER.size
+        while True:
+            frame = f.read(_FRAME.size)
+            if len(frame) < _FRAME.size:
+                return frames
+            record_magic, kind, length, checksum = _FRAME.unpack(frame)
+            if record_magic != RECORD_MAGIC or kind not in (FULL, DELTA):
+                raise ValueError(f"{path} is corrupt: bad record header at byte {offset}.")
+            payload_offset = offset + _FRAME.size
+            if payload_offset + length > size:
+                return frames
+            frames.append((kind, payload_offset, length, checksum))
+            offset = f.seek(payload_offset + length)
+
+def count_snapshots(path):
+    """Return the number of complete snapshots in the file."""
+    return len(_scan_frames(path))
+
+def restore(path, snapshot=-1):
+    """
+    Rebuild a robot from a checkpoint file.
+    By default the latest snapshot is restored; pass a snapshot number (0 is the first) to fork from an earlier one.
+    """
+    frames = _scan_frames(path)
+    if snapshot < 0:
+        snapshot += len(frames)
+    if not 0 <= snapshot < len(frames):
+        raise ValueError(f"{path} has no snapshot {snapshot}.")
+
+    # Only read from the last full record at or before the requested snapshot.
+    start = snapshot
+    while start > 0 and frames[start][0] != FULL:
+        start -= 1
+    if frames[start][0] != FULL:
+        raise ValueError(f"{path} has no full snapshot before snapshot {snapshot}.")
+    state = None
+    with open(path, "rb") as f:
+        for kind, offset, length, checksum in frames[start:snapshot + 1]:
+            f.seek(offset)
+            payload = f.read(length)
+            if zlib.crc32(payload) != checksum:
+                raise ValueError(f"{path} is corrupt: checksum mismatch in the record at byte {offset - _FRAME.size}.")
+            record = json.loads(zlib.decompress(payload))
+            if kind == FULL:
+                state = record
+                state["pending"] = set(_cells(state["pending"]))
+                state["history"] = _cells(state["history"])
+            else:
+                _apply_delta(state, record)
+
+    grid_size, obstacles, no_entry_zones, one_way_streets, map_version = state["map"]
+    one_way_streets = {(x, y): d for x, y, d in one_way_streets}
+    environment = Environment(grid_size, state["pending"], _cells(obstacles), _cells(no_entry_zones),
+                              one_way_streets)
+    environment.version = map_version
+    robot = SmartDeliveryRobot(environment, *state["position"], planner=state["planner"])
+    robot.delivered_points = set(state["history"])
+    robot.delivery_history = state["history"]
+    robot.planned_paths.extend(_cells(path) for path in state["plan"])
+    robot.planned_version = state["plan_version"]
+    robot.unreachable_points = set(_cells(state["unreachable"]))
+    return robot
+
+def _apply_delta(state, record):
+    state["position"] = record["position"]
+    delivered = _cells(record["history"])
+    state["pending"].difference_update(delivered)
+    state["history"].extend(delivered)
+    if "map" in record:
+        state["map"] = record["map"]
+    if "plan_dropped" in record:
+        del state["plan"][:record["plan_dropped"]]
+    else:
+        state["plan"] = record["plan"]
+        state["plan_version"] = record["plan_version"]
+        state["unreachable"] = record["unreachable"]
@@ -0,0 +1,110 @@
+# Environment Model
+
+# The urban grid the robot operates in. An Environment holds the grid size, the pending delivery points and the
+# map constraints introduced in Advanced Task 1 (obstacles, no-entry zones and one-way streets). The basic tasks
+# simply use an Environment with no constraints. The helpers below prompt the user for the grid size and
+# starting position and randomly generate each kind of cell, keeping generated cells off reserved ones.
+
+# The map version must be bumped (mark_changed) whenever the map constraints are modified, so that plans and
+# checkpoints made against an older map can be recognised as stale.
+
+import random
+
+
+class Environment:
+    def __init__(self, grid_size, delivery_points=(), obstacles=(), no_entry_zones=(), one_way_streets=None):
+        self.grid_size = grid_size
+        self.delivery_points = set(delivery_points)
+        self.obstacles = set(obstacles)
+        self.no_entry_zones = set(no_entry_zones)
+        self.one_way_streets = dict(one_way_streets or {})
+        self.version = 0
+
+    def mark_changed(self):
+        """Record that the map constraints have been modified."""
+        self.version += 1
+
+    def in_bounds(self, cell):
+        """Return True if the cell lies on the grid."""
+        return 1 <= cell[0] <= self.grid_size and 1 <= cell[1] <= self.grid_size
+
+    def is_blocked(self, cell):
+        """Return True if the robot may not enter the cell."""
+        return cell in self.obstacles or cell in self.no_entry_zones
+
+# --- User Input ---
+
+def get_grid_size(prompt="Enter the grid size (N x N, where N is between 1 and 6): ",
+                  range_error="Invalid input. Please enter a number between 1 and 6.",
+                  value_error="Invalid input. Please enter a valid integer."):
+    """Prompt the user to enter a grid size (N x N) where 1 <= N <= 6. Scripts may pass their own wording."""
+    while True:
+        try:
+            N = int(input(prompt))
+            if 1 <= N <= 6:
+                return N
+            else:
+                print(range_error)
+        except ValueError:
+            print(value_error)
+
+def get_starting_position(N, prompt="Enter the robot's starting position (x y): ",
+                          range_error="Invalid position. Enter values between 1 and {N}.",
+                          value_error="Invalid input. Enter two integers separated by a space."):
+    """Prompt the user for the robot's starting position on an N x N grid. range_error may use {N}."""
+    while True:
+        try:
+            x, y = map(int, input(prompt).split())
+            if 1 <= x <= N and 1 <= y <= N:
+                return x, y
+            else:
+                print(range_error.format(N=N))
+        except ValueError:
+            print(value_error)
+
+# --- Random Generation ---
+
+def _random_cells(N, count, reserved):
+    """Pick count distinct random cells on the grid, avoiding reserved cells."""
+    cells = set()
+    while len(cells) < count:
+        cell = (random.randint(1, N), random.randint(1, N))
+        if cell not in reserved:
+            cells.add(cell)
+    return cells
+
+def generate_delivery_points(N, num_deliveries=None):
+    """Generate a list of delivery points, by default on up to roughly half the grid cells."""
+    if num_deliveries is None:
+        num_deliveries = random.randint(1, (N * N) // 2)
+    return list(_random_cells(N, num_deliveries, ()))
+
+def generate_obstacles(N, reserved, num_obstacles=None):
+    """Generate obstacles, by default on up to a quarter of the grid cells, avoiding reserved cells."""
+    if num_obstacles is None:
+        num_obstacles = random.randint(1, (N * N) // 4)
+    return _random_cells(N, num_obstacles, reserved)
+
+def generate_no_entry_zones(N, reserved, num_zones=None):
+    """Generate no-entry zones, by default on up to a quarter of the grid cells, avoiding reserved cells."""
+    if num_zones is None:
+        num_zones = random.randint(1, (N * N) // 4)
+    return _random_cells(N, num_zones, reserved)
+
+def generate_one_way_streets(N, reserved, num_streets=None):
+    """Generate one-way streets as a dict mapping coordinates to an allowed direction."""
+    if num_streets is None:
+        num_streets = random.randint(1, (N * N) // 4)
+    directions = ["up", "down", "left", "right"]
+    return {cell: random.choice(directions) for cell in _random_cells(N, num_streets, reserved)}
+
+def generate_environment(N):
+    """Generate a full advanced environment; delivery points take priority, then obstacles and no-entry zones."""
+    delivery_points = generate_delivery_points(N)
+    reserved = set(delivery_points)
+    obstacles = generate_obstacles(N, reserved)
+    reserved = reserved.union(obstacles)
+    no_entry_zones = generate_no_entry_zones(N, reserved)
+    reserved = reserved.union(no_entry_zones)
+    one_way_streets = generate_one_way_streets(N, reserved)
+    return Environment(N, delivery_points, obstacles, no_entry_zones, one_way_streets)
@@ -0,0 +1,115 @@
+# Path Planning
+
+# Every planner takes a start cell, a goal cell and an Environment, and returns the path between them as a list
+# of cells (start and goal included), or None when the goal cannot be reached. Planners are looked up by name in
+# a registry so the robot can be configured with any of them:
+
+#   - "manhattan": the Task 3 strategy, moving vertically and then horizontally straight towards the goal. It
+#     ignores map constraints and is only meant for the basic, unconstrained grid.
+#   - "astar": the Advanced Task 2 A* search, using Manhattan distance as the heuristic and a priority queue
+#     (heapq) for the frontier, respecting obstacles, no-entry zones and one-way streets.
+
+import heapq
+
+PLANNERS = {}
+
+def register_planner(name):
+    """Decorator that registers a planner function under the given name."""
+    def decorator(planner):
+        PLANNERS[name] = planner
+        return planner
+    return decorator
+
+def get_planner(name):
+    """Return the planner registered under name."""
+    try:
+        return PLANNERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown planner '{name}'. Available planners: {', '.join(sorted(PLANNERS))}") from None
+
+# --- Helper Functions for A* Search ---
+
+def heuristic(a, b):
+    """Return the Manhattan distance between points a and b."""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+def get_neighbors(cell, environment):
+    """
+    Return valid neighbor cells for a given cell.
+    If the cell is under a one-way constraint, only return the allowed move.
+    Skip neighbors that fall into obstacles or no-entry zones.
+    """
+    (x, y) = cell
+    # Default directions: up, down, left, right
+    directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+    # Enforce one-way constraint if applicable
+    if cell in environment.one_way_streets:
+        d = environment.one_way_streets[cell]
+        if d == "up":
+            directions = [(-1, 0)]
+        elif d == "down":
+            directions = [(1, 0)]
+        elif d == "left":
+            directions = [(0, -1)]
+        elif d == "right":
+            directions = [(0, 1)]
+
+    neighbors = []
+    for dx, dy in directions:
+        next_cell = (x + dx, y + dy)
+        if environment.in_bounds(next_cell) and not environment.is_blocked(next_cell):
+            neighbors.append(next_cell)
+    return neighbors
+
+# --- Planners ---
+
+@register_planner("manhattan")
+def manhattan_path(start, goal, environment):
+    """Move vertically and then horizontally towards the goal, one cell at a time."""
+    (x, y) = start
+    path = [start]
+    while x != goal[0]:
+        x += 1 if x < goal[0] else -1
+        path.append((x, y))
+    while y != goal[1]:
+        y += 1 if y < goal[1] else -1
+        path.append((x, y))
+    return path
+
+@register_planner("astar")
+def a_star_search(start, goal, environment):
+    """
+    Perform A* search from start to goal on the environment's grid.
+    Returns the optimal path as a list of cells if found, otherwise None.
+    """
+    frontier = []
+    heapq.heappush(frontier, (0, start))
+    came_from = {start: None}
+    cost_so_far = {start: 0}
+
+    while frontier:
+        current_priority, current = heapq.heappop(frontier)
+        if current == goal:
+            break
+
+        for next_cell in get_neighbors(current, environment):
+            new_cost = cost_so_far[current] + 1  # assume each move costs 1
+            if next_cell not in cost_so_far or new_cost < cost_so_far[next_cell]:
+                cost_so_far[next_cell] = new_cost
+                priority = new_cost + heuristic(goal, next_cell)
+                heapq.heappush(frontier, (priority, next_cell))
+                came_from[next_cell] = current
+
+    if goal not in came_from:
+        return None  # no path found
+
+    # Reconstruct path from goal to start
+    path = []
+    current = goal
+    while current != start:
+        path.append(current)
+        current = came_from[current]
+    path.append(start)
+    path.reverse()
+    return path
@@ -0,0 +1,43 @@
+# Grid Rendering
+
+# Text rendering of the environment, shared by every task. Each cell is printed as its coordinates followed by
+# a label (Clear, Delivery, Obstacle, NoEntry, OneWay:<direction> or Robot), one grid row per line. Later
+# labels take priority over earlier ones, so the robot is always shown on top. A robot passes in its own set of
+# pending deliveries; otherwise the environment's delivery points are shown. Scripts that word a label
+# differently (Advanced Task 1 prints "No-Entry") pass their own labels, which override LABELS.
+
+LABELS = {
+    "clear": "Clear",
+    "delivery": "Delivery",
+    "obstacle": "Obstacle",
+    "no_entry": "NoEntry",
+    "one_way": "OneWay",
+    "robot": "Robot",
+}
+
+
+def format_grid(environment, robot_position=None, delivery_points=None, labels=None):
+    """Return the grid as a list of text rows."""
+    if delivery_points is None:
+        delivery_points = environment.delivery_points
+    labels = {**LABELS, **(labels or {})}
+    N = environment.grid_size
+    grid = [[f"({x},{y}) {labels['clear']}" for y in range(1, N + 1)] for x in range(1, N + 1)]
+    for (dx, dy) in delivery_points:
+        grid[dx - 1][dy - 1] = f"({dx},{dy}) {labels['delivery']}"
+    for (dx, dy) in environment.obstacles:
+        grid[dx - 1][dy - 1] = f"({dx},{dy}) {labels['obstacle']}"
+    for (dx, dy) in environment.no_entry_zones:
+        grid[dx - 1][dy - 1] = f"({dx},{dy}) {labels['no_entry']}"
+    for (dx, dy), d in environment.one_way_streets.items():
+        grid[dx - 1][dy - 1] = f"({dx},{dy}) {labels['one_way']}:{d}"
+    if robot_position is not None:
+        x, y = robot_position
+        grid[x - 1][y - 1] = f"({x},{y}) {labels['robot']}"
+    return [" | ".join(row) for row in grid]
+
+def display_grid(environment, robot_position=None, delivery_points=None, labels=None):
+    """Print the grid followed by a blank line."""
+    for row in format_grid(environment, robot_position, delivery_points, labels):
+        print(row)
+    print()
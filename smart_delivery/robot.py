@@ -0,0 +1,167 @@
+# Robot Engine
+
+# The Smart Delivery Robot used by every task. The robot moves around an Environment, delivers parcels when it
+# stands on a delivery point and, when run, autonomously visits the nearest remaining delivery point until all
+# parcels are delivered. How it gets to each target is decided by a planner from the planning registry: Task 3
+# uses the simple "manhattan" planner and Advanced Task 2 the "astar" planner. The robot keeps its own set of
+# pending deliveries, so running it leaves the Environment untouched. The process pool used by run_planned is
+# only imported when it is first needed. Both run methods accept an optional Checkpointer (see checkpoint.py)
+# that snapshots the simulation after every leg.
+
+from collections import deque
+
+from .planning import get_planner
+from .render import display_grid
+from .spatial_index import DeliveryIndex
+
+
+class SmartDeliveryRobot:
+    def __init__(self, environment, start_x, start_y, planner="astar", show_paths=True):
+        self.environment = environment
+        self.grid_size = environment.grid_size
+        self.x = start_x
+        self.y = start_y
+        self.delivery_points = set(environment.delivery_points)
+        self.delivery_index = DeliveryIndex(self.delivery_points)
+        self.delivered_points = set()
+        self.delivery_history = []  # delivered points in the order they were delivered
+        self.planned_paths = deque()  # remaining legs of the tour planned by run_planned
+        self.planned_version = None  # map version the remaining legs were planned against
+        self.unreachable_points = set()  # pending points the remaining legs leave out because no path reaches them
+        self.planner_name = planner
+        self.planner = get_planner(planner)
+        self.show_paths = show_paths  # print each planned path before following it (Task 3 does not)
+
+    # --- Movement ---
+
+    def move(self, dx, dy):
+        """Move by (dx, dy) if the destination is on the grid and not blocked."""
+        new_cell = (self.x + dx, self.y + dy)
+        if self.environment.in_bounds(new_cell) and not self.environment.is_blocked(new_cell):
+            self.x, self.y = new_cell
+            print(f"Moved to ({self.x},{self.y})")
+        else:
+            print("Invalid move. Staying in place.")
+
+    def _move_in_direction(self, dx, dy, direction):
+        """Move one cell in the named direction, as in Task 2."""
+        new_cell = (self.x + dx, self.y + dy)
+        if self.environment.in_bounds(new_cell) and not self.environment.is_blocked(new_cell):
+            self.x, self.y = new_cell
+            print(f"Moved {direction} to ({self.x},{self.y})")
+        else:
+            print(f"Cannot move {direction}.")
+
+    def move_left(self):
+        self._move_in_direction(0, -1, "left")
+
+    def move_right(self):
+        self._move_in_direction(0, 1, "right")
+
+    def move_up(self):
+        self._move_in_direction(-1, 0, "up")
+
+    def move_down(self):
+        self._move_in_direction(1, 0, "down")
+
+    def move_along_path(self, path):
+        """Follow the given path, updating the robot's position and displaying the grid."""
+        for cell in path[1:]:
+            self.x, self.y = cell
+            print(f"Moved to ({self.x},{self.y})")
+            self.display_grid()
+
+    # --- Deliveries ---
+
+    def deliver(self):
+        """Perform delivery if the robot is at a delivery point. Returns True if a parcel was delivered."""
+        if (self.x, self.y) in self.delivery_points:
+            self.delivery_points.remove((self.x, self.y))
+            self.delivery_index.discard((self.x, self.y))
+            self.delivered_points.add((self.x, self.y))
+            self.delivery_history.append((self.x, self.y))
+            print(f"Delivered at ({self.x},{self.y})")
+            self.display_grid()
+            return True
+        print(f"No delivery at ({self.x},{self.y})")
+        return False
+
+    def all_delivered(self):
+        """Check if all deliveries have been completed."""
+        return len(self.delivery_points) == 0
+
+    def display_grid(self):
+        """Display the grid with all elements and the robot's current position."""
+        display_grid(self.environment, (self.x, self.y), self.delivery_points)
+
+    # --- Autonomous Navigation ---
+
+    def navigate_to_target(self, target):
+        """Calculate a path to the target with the robot's planner and move along it. Returns False if unreachable."""
+        path = self.planner((self.x, self.y), target, self.environment)
+        if path is None:
+            print(f"No available path to {target}.")
+            return False
+        if self.show_paths:
+            print(f"Path to {target}: {path}")
+        self.move_along_path(path)
+        self.deliver()
+        return True
+
+    def run(self, checkpointer=None):
+        """Autonomously navigate to deliver all parcels."""
+        while len(self.delivery_index):
+            # Select the nearest delivery point using Manhattan distance
+            target = self.delivery_index.nearest((self.x, self.y))
+            if not self.navigate_to_target(target):
+                # Set unreachable targets aside so the robot carries on with the rest.
+                self.delivery_index.discard(target)
+            elif checkpointer is not None:
+                checkpointer.snapshot(self)
+        if self.all_delivered():
+            print("All deliveries completed!")
+        else:
+            print("Deliveries remaining:", self.delivery_points)
+
+    def plan_route(self, workers=None):
+        """Fix the delivery order and plan every leg of it up front. Returns the leg paths and the unreachable stops."""
+        from .tour import compile_map, order_tour, plan_tour
+        tour = order_tour((self.x, self.y), self.delivery_points)
+        return plan_tour((self.x, self.y), tour, compile_map(self.environment), self.planner_name, workers)
+
+    def has_current_plan(self):
+        """
+        Check that the remaining planned legs can be followed as they are: they were planned against the current
+        map, the next leg starts where the robot is, and they end at exactly the pending delivery points that were
+        not found to be unreachable.
+        """
+        if not self.planned_paths or self.planned_version != self.environment.version:
+            return False
+        if self.planned_paths[0][0] != (self.x, self.y):
+            return False
+        return {path[-1] for path in self.planned_paths} == self.delivery_points - self.unreachable_points
+
+    def run_planned(self, workers=None, checkpointer=None):
+        """
+        Plan the whole tour before moving, then follow it leg by leg to deliver all parcels.
+        Legs left over from an earlier call (e.g. restored from a checkpoint) are reused if they still fit.
+        """
+        from .tour import stitch_route
+        if not self.has_current_plan():
+            paths, unreachable = self.plan_route(workers)
+            for target in unreachable:
+                print(f"No available path to {target}.")
+            self.planned_paths = deque(paths)
+            self.planned_version = self.environment.version
+            self.unreachable_points = set(unreachable)
+        print(f"Planned route: {stitch_route(self.planned_paths)}")
+        while self.planned_paths:
+            self.move_along_path(self.planned_paths[0])
+            self.deliver()
+            self.planned_paths.popleft()
+            if checkpointer is not None:
+                checkpointer.snapshot(self)
+        if self.all_delivered():
+            print("All deliveries completed!")
+        else:
+            print("Deliveries remaining:", self.delivery_points)
@@ -0,0 +1,132 @@
+# Spatial Index for Pending Deliveries
+
+# The delivery robot repeatedly picks the delivery point closest to it by Manhattan distance. Scanning every
+# pending point with min() is fine for a 6x6 grid, but it becomes the main cost once there are thousands of
+# parcels waiting. This module keeps the pending points in a grid of square
+# buckets so that a nearest-point lookup only has to look at the buckets around the robot, searching outward
+# ring by ring until no unvisited bucket can hold anything closer. Adding and removing points is O(1).
+
+import math
+
+
+class DeliveryIndex:
+    def __init__(self, points=(), bucket_size=None):
+        points = list(points)
+        if bucket_size is None:
+            # Aim for roughly one point per bucket; spread the points over their bounding box.
+            if points:
+                xs = [p[0] for p in points]
+                ys = [p[1] for p in points]
+                area = (max(xs) - min(xs) + 1) * (max(ys) - min(ys) + 1)
+                bucket_size = max(1, int(math.sqrt(area / len(points))))
+            else:
+                bucket_size = 1
+        self.bucket_size = bucket_size
+        self.buckets = {}
+        self.count = 0
+        # Bounds of the occupied buckets, used to stop the ring search early.
+        self.min_bx = self.max_bx = self.min_by = self.max_by = 0
+        for p in points:
+            self.add(p)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, point):
+        bucket = self.buckets.get(self._bucket_of(point))
+        return bucket is not None and point in bucket
+
+    def _bucket_of(self, point):
+        return (point[0] // self.bucket_size, point[1] // self.bucket_size)
+
+    def add(self, point):
+        """Add a point to the index (no-op if it is already present)."""
+        key = self._bucket_of(point)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = set()
+        if point in bucket:
+            return
+        bucket.add(point)
+        if self.count == 0:
+            self.min_bx = self.max_bx = key[0]
+            self.min_by = self.max_by = key[1]
+        else:
+            self.min_bx = min(self.min_bx, key[0])
+            self.max_bx = max(self.max_bx, key[0])
+            self.min_by = min(self.min_by, key[1])
+            self.max_by = max(self.max_by, key[1])
+        self.count += 1
+
+    def discard(self, point):
+        """Remove a point from the index if it is present."""
+        key = self._bucket_of(point)
+        bucket = self.buckets.get(key)
+        if bucket is None or point not in bucket:
+            return
+        bucket.remove(point)
+        if not bucket:
+            del self.buckets[key]
+        self.count -= 1
+
+    def nearest(self, position):
+        """Return the indexed point closest to position by Manhattan distance, or None if the index is empty."""
+        if self.count == 0:
+            return None
+        px, py = position
+        cx, cy = self._bucket_of(position)
+        # The furthest ring that can still contain an occupied bucket.
+        max_ring = max(cx - self.min_bx, self.max_bx - cx, cy - self.min_by, self.max_by - cy, 0)
+        best = None
+        best_dist = None
+        keys_walked = 0
+        for ring in range(max_ring + 1):
+            # The bounds above never shrink, so late in a tour the rings can be mostly empty. Once walking them
+            # would cost more than looking at every occupied bucket, finish the search over the buckets instead.
+            ring_keys = 8 * ring if ring else 1
+            if keys_walked + ring_keys > len(self.buckets):
+                return self._nearest_in_buckets(position, best, best_dist)
+            keys_walked += ring_keys
+            for key in self._ring(cx, cy, ring):
+                bucket = self.buckets.get(key)
+                if not bucket:
+                    continue
+                for p in bucket:
+                    d = abs(p[0] - px) + abs(p[1] - py)
+                    if best_dist is None or d < best_dist:
+                        best, best_dist = p, d
+            # Every point in ring + 1 or beyond is at least ring * bucket_size + 1 away.
+            if best_dist is not None and best_dist <= ring * self.bucket_size:
+                break
+        return best
+
+    def _nearest_in_buckets(self, position, best, best_dist):
+        """Finish a nearest-point search by checking every occupied bucket that could beat best_dist."""
+        px, py = position
+        size = self.bucket_size
+        for (bx, by), bucket in self.buckets.items():
+            if best_dist is not None:
+                # Distance from position to the closest cell the bucket covers.
+                low_x, low_y = bx * size, by * size
+                bound = (max(0, low_x - px, px - (low_x + size - 1))
+                         + max(0, low_y - py, py - (low_y + size - 1)))
+                if bound >= best_dist:
+                    continue
+            for p in bucket:
+                d = abs(p[0] - px) + abs(p[1] - py)
+                if best_dist is None or d < best_dist:
+                    best, best_dist = p, d
+        return best
+
+    @staticmethod
+    def _ring(cx, cy, ring):
+        """Yield the bucket keys at Chebyshev distance ring from (cx, cy)."""
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for bx in range(cx - ring, cx + ring + 1):
+            yield (bx, cy - ring)
+            yield (bx, cy + ring)
+        for by in range(cy - ring + 1, cy + ring):
+            yield (cx - ring, by)
+            yield (cx + ring, by)
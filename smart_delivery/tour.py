@@ -0,0 +1,112 @@
+# Tour Planning
+
+# Once the delivery order is fixed, every leg of the tour is an independent search on the same static map, so
+# the legs can be planned in parallel with a process pool. The map is compiled into a frozen Environment and
+# handed to each worker process once when the pool starts, rather than being pickled again with every leg.
+# Starting worker processes costs far more than planning a short tour, so tours are planned serially unless the
+# caller asks for workers or the tour has at least PARALLEL_MIN_LEGS legs.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+
+from .environment import Environment
+from .planning import get_planner
+from .spatial_index import DeliveryIndex
+
+PARALLEL_MIN_LEGS = 1000
+
+_worker_map = None
+_worker_planner = None
+
+
+class CompiledMap(Environment):
+    """An Environment whose map constraints are frozen. It has no delivery points; planning does not need them."""
+
+    def __init__(self, environment):
+        super().__init__(environment.grid_size)
+        self.obstacles = frozenset(environment.obstacles)
+        self.no_entry_zones = frozenset(environment.no_entry_zones)
+        self.one_way_streets = MappingProxyType(dict(environment.one_way_streets))
+        self.delivery_points = frozenset()
+        self.version = environment.version
+
+    def __getstate__(self):
+        # Mapping proxies cannot be pickled, so send the one-way streets to worker processes as a plain dict.
+        state = self.__dict__.copy()
+        state["one_way_streets"] = dict(self.one_way_streets)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.one_way_streets = MappingProxyType(state["one_way_streets"])
+
+def compile_map(environment):
+    """Freeze the environment's map constraints into a read-only copy that can be shared with worker processes."""
+    return CompiledMap(environment)
+
+def _init_worker(compiled_map, planner):
+    """Store the compiled map and the planner in the worker process."""
+    global _worker_map, _worker_planner
+    _worker_map = compiled_map
+    _worker_planner = get_planner(planner)
+
+def _plan_leg(leg):
+    """Plan a single (start, goal) leg against the worker's compiled map."""
+    start, goal = leg
+    return _worker_planner(start, goal, _worker_map)
+
+def order_tour(start, delivery_points):
+    """Order the delivery points greedily, always visiting the nearest remaining point next."""
+    index = DeliveryIndex(delivery_points)
+    tour = []
+    current = start
+    while len(index):
+        current = index.nearest(current)
+        index.discard(current)
+        tour.append(current)
+    return tour
+
+def plan_tour(start, tour, compiled_map, planner="astar", workers=None):
+    """
+    Plan every leg of an ordered tour, in parallel when more than one worker is used. By default (workers=None)
+    tours with fewer than PARALLEL_MIN_LEGS legs are planned serially and longer ones use every CPU.
+    Returns (paths, unreachable): the leg paths in tour order and the stops that could not be reached. When a
+    stop is unreachable its leg is dropped and the next stop is planned from the last stop that was reached.
+    """
+    stops = [start] + list(tour)
+    legs = list(zip(stops, stops[1:]))
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(legs) >= PARALLEL_MIN_LEGS else 1
+    workers = min(workers, len(legs))
+
+    planned = None
+    if workers > 1:
+        chunksize = max(1, len(legs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(compiled_map, planner)) as pool:
+            planned = list(pool.map(_plan_leg, legs, chunksize=chunksize))
+
+    plan_leg = get_planner(planner)
+    paths = []
+    unreachable = []
+    current = start
+    for i, (leg_start, goal) in enumerate(legs):
+        # Legs are planned here in the serial case, or again when an earlier stop was dropped.
+        if planned is None or leg_start != current:
+            path = plan_leg(current, goal, compiled_map)
+        else:
+            path = planned[i]
+        if path is None:
+            unreachable.append(goal)
+            continue
+        paths.append(path)
+        current = goal
+    return paths, unreachable
+
+def stitch_route(paths):
+    """Join consecutive leg paths into one route, dropping the repeated cell where legs meet."""
+    route = []
+    for path in paths:
+        route.extend(path[1:] if route else path)
+    return route
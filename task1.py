@@ -8,35 +8,8 @@
 
 import random
 
-# Step 1: Define the Grid Size
-def get_grid_size():
-    while True:
-        try:
-            N = int(input("Enter the grid size (N x N, where N is between 1 and 6): "))
-            if 1 <= N <= 6:
-                return N
-            else:
-                print("Invalid input. Please enter a number between 1 and 6.")
-        except ValueError:
-            print("Invalid input. Please enter a valid integer.")
-
-# Step 2: Generate Delivery Points
-def generate_delivery_points(N, num_deliveries):
-    delivery_points = []
-    while len(delivery_points) < num_deliveries:
-        x = random.randint(1, N)
-        y = random.randint(1, N)
-        if (x, y) not in delivery_points:
-            delivery_points.append((x, y))
-    return delivery_points
-
-# Step 3: Display the Grid
-def display_grid(N, delivery_points):
-    grid = [[f"({x},{y}) Clear" for y in range(1, N + 1)] for x in range(1, N + 1)]
-    for (x, y) in delivery_points:
-        grid[x - 1][y - 1] = f"({x},{y}) Delivery"
-    for row in grid:
-        print(" | ".join(row))
+from smart_delivery.environment import Environment, generate_delivery_points, get_grid_size
+from smart_delivery.render import format_grid
 
 # Main function to run Task 1
 def main():
@@ -49,7 +22,8 @@ def main():
     
     # Step 3: Display the grid
     print("\nGenerated Environment:")
-    display_grid(N, delivery_points)
+    for row in format_grid(Environment(N, delivery_points)):
+        print(row)
 
 # Run the program
 if __name__ == "__main__":
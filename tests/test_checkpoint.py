@@ -0,0 +1,153 @@
+import os
+import random
+
+import pytest
+
+from smart_delivery import Checkpointer, Environment, SmartDeliveryRobot, count_snapshots, restore
+
+
+def make_environment(seed=2, N=30):
+    rng = random.Random(seed)
+    obstacles = {(rng.randint(1, N), rng.randint(1, N)) for _ in range(60)}
+    one_way_streets = {(rng.randint(1, N), rng.randint(1, N)): "right" for _ in range(5)}
+    points = {(rng.randint(1, N), rng.randint(1, N)) for _ in range(80)}
+    points -= obstacles | set(one_way_streets) | {(1, 1)}
+    obstacles -= {(1, 1)}
+    return Environment(N, points, obstacles, (), one_way_streets)
+
+def state_of(robot):
+    return ((robot.x, robot.y), set(robot.delivery_points), list(robot.delivery_history),
+            [list(path) for path in robot.planned_paths], robot.planned_version, robot.environment.version,
+            robot.environment.obstacles, robot.environment.one_way_streets, set(robot.unreachable_points))
+
+class RecordingCheckpointer(Checkpointer):
+    """Checkpointer that also keeps the robot state at every snapshot, to compare restores against."""
+
+    def __init__(self, path, **kwargs):
+        super().__init__(path, **kwargs)
+        self.states = []
+
+    def snapshot(self, robot):
+        super().snapshot(robot)
+        self.states.append(state_of(robot))
+
+def run_shift(path, full_every=5):
+    robot = SmartDeliveryRobot(make_environment(), 1, 1)
+    checkpointer = RecordingCheckpointer(path, full_every=full_every)
+    robot.run_planned(workers=1, checkpointer=checkpointer)
+    return robot, checkpointer.states
+
+
+def test_every_snapshot_round_trips(tmp_path):
+    path = str(tmp_path / "shift.ckpt")
+    _, states = run_shift(path)
+    assert count_snapshots(path) == len(states) > 10
+    for number, state in enumerate(states):
+        assert state_of(restore(path, number)) == state
+    assert state_of(restore(path)) == states[-1]
+
+def test_map_change_is_recorded_in_delta(tmp_path):
+    path = str(tmp_path / "shift.ckpt")
+    environment = make_environment()
+    robot = SmartDeliveryRobot(environment, 1, 1)
+    checkpointer = Checkpointer(path)
+    robot.navigate_to_target(robot.delivery_index.nearest((robot.x, robot.y)))
+    checkpointer.snapshot(robot)
+    environment.obstacles.add((30, 30))
+    environment.mark_changed()
+    robot.navigate_to_target(robot.delivery_index.nearest((robot.x, robot.y)))
+    checkpointer.snapshot(robot)
+    assert state_of(restore(path)) == state_of(robot)
+
+def test_fork_from_earlier_snapshot(tmp_path):
+    path = str(tmp_path / "shift.ckpt")
+    _, states = run_shift(path)
+    size = os.path.getsize(path)
+    fork = restore(path, snapshot=7)
+    assert state_of(fork) == states[7]
+    fork.run_planned(workers=1, checkpointer=Checkpointer(str(tmp_path / "fork.ckpt")))
+    assert fork.all_delivered()
+    assert os.path.getsize(path) == size
+
+def test_truncated_tail_is_ignored_and_resume_appends_cleanly(tmp_path):
+    path = str(tmp_path / "shift.ckpt")
+    robot, states = run_shift(path)
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 7)
+    assert count_snapshots(path) == len(states) - 1
+    resumed = restore(path)
+    assert state_of(resumed) == states[-2]
+
+    resumed.run_planned(workers=1, checkpointer=Checkpointer(path))
+    assert resumed.all_delivered()
+    assert count_snapshots(path) == len(states)
+    assert state_of(restore(path)) == state_of(resumed)
+
+def test_corrupt_payload_is_detected(tmp_path):
+    path = str(tmp_path / "shift.ckpt")
+    run_shift(path)
+    # Byte 40 lies in the payload of the first record, which only a restore of snapshot 0 reads.
+    with open(path, "r+b") as f:
+        f.seek(40)
+        byte = f.read(1)
+        f.seek(40)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    with pytest.raises(ValueError, match="checksum"):
+        restore(path, snapshot=0)
+
+def test_corrupt_frame_header_is_detected(tmp_path):
+    path = str(tmp_path / "shift.ckpt")
+    run_shift(path)
+    with open(path, "r+b") as f:
+        f.seek(5)
+        f.write(b"XX")
+    with pytest.raises(ValueError, match="corrupt"):
+        restore(path)
+    with pytest.raises(ValueError):
+        Checkpointer(path)
+
+@pytest.mark.parametrize("torn_length", [0, 1, 4])
+def test_torn_header_is_rewritten(tmp_path, torn_length):
+    path = str(tmp_path / "shift.ckpt")
+    with open(path, "wb") as f:
+        f.write(b"SDRC\x02"[:torn_length])
+    robot = SmartDeliveryRobot(make_environment(), 1, 1)
+    robot.run_planned(workers=1, checkpointer=Checkpointer(path))
+    assert state_of(restore(path)) == state_of(robot)
+
+def test_foreign_file_is_not_overwritten(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"hi")
+    with pytest.raises(ValueError):
+        Checkpointer(str(path))
+    assert path.read_bytes() == b"hi"
+
+def test_restore_with_unreachable_stop_keeps_plan(tmp_path):
+    # (5, 5) is boxed in by obstacles, so the planned tour leaves it out.
+    obstacles = {(4, 5), (6, 5), (5, 4), (5, 6)}
+    environment = Environment(8, [(5, 5), (7, 7), (3, 6)], obstacles)
+    robot = SmartDeliveryRobot(environment, 1, 1)
+    path = str(tmp_path / "shift.ckpt")
+    robot.run_planned(workers=1, checkpointer=Checkpointer(path))
+    assert robot.delivery_points == {(5, 5)}
+
+    restored = restore(path, snapshot=0)
+    assert restored.unreachable_points == {(5, 5)}
+    assert restored.has_current_plan()
+    restored.plan_route = lambda workers=None: pytest.fail("restored plan should be reused, not replanned")
+    restored.run_planned(workers=1)
+    assert restored.delivery_points == {(5, 5)}
+
+def test_restored_plan_is_replanned_when_it_no_longer_fits(tmp_path):
+    path = str(tmp_path / "shift.ckpt")
+    run_shift(path)
+    robot = restore(path, snapshot=3)
+    assert robot.has_current_plan()
+    extra = next((x, y) for x in range(1, 31) for y in range(1, 31)
+                 if (x, y) not in robot.delivery_points and not robot.environment.is_blocked((x, y))
+                 and (x, y) not in robot.environment.one_way_streets and (x, y) != (robot.x, robot.y))
+    robot.delivery_points.add(extra)
+    robot.delivery_index.add(extra)
+    assert not robot.has_current_plan()
+    robot.run_planned(workers=1)
+    assert extra in robot.delivered_points
@@ -0,0 +1,30 @@
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the smart_delivery and concurrent modules it loaded."""
+    script = code + (
+        "\nimport json, sys"
+        "\nprint(json.dumps(sorted(m for m in sys.modules if m.startswith(('smart_delivery', 'concurrent')))))"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True,
+                            check=True)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+def test_plain_import_loads_no_submodules():
+    assert loaded_modules("import smart_delivery") == {"smart_delivery"}
+
+def test_robot_import_leaves_process_pool_unloaded():
+    modules = loaded_modules("from smart_delivery import SmartDeliveryRobot")
+    assert "smart_delivery.robot" in modules
+    assert "smart_delivery.tour" not in modules
+    assert not any(m.startswith("concurrent") for m in modules)
+
+def test_tour_planning_loads_process_pool():
+    modules = loaded_modules("from smart_delivery import plan_tour")
+    assert {"smart_delivery.tour", "concurrent.futures"} <= modules
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from smart_delivery.spatial_index import DeliveryIndex
+
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+def assert_nearest(index, pending, query):
+    found = index.nearest(query)
+    if not pending:
+        assert found is None
+    else:
+        assert found in pending
+        assert manhattan(found, query) == min(manhattan(p, query) for p in pending)
+
+
+@pytest.mark.parametrize("bucket_size", [None, 1, 3, 17])
+def test_nearest_matches_brute_force_under_random_adds_and_discards(bucket_size):
+    rng = random.Random(bucket_size or 0)
+    for _ in range(40):
+        N = rng.randint(1, 120)
+        pending = {(rng.randint(1, N), rng.randint(1, N)) for _ in range(rng.randint(1, 200))}
+        index = DeliveryIndex(pending, bucket_size=bucket_size)
+        for _ in range(300):
+            action = rng.random()
+            if action < 0.3:
+                point = (rng.randint(1, N), rng.randint(1, N))
+                index.add(point)
+                pending.add(point)
+            elif action < 0.6 and pending:
+                point = rng.choice(sorted(pending))
+                index.discard(point)
+                pending.discard(point)
+            assert_nearest(index, pending, (rng.randint(-5, N + 5), rng.randint(-5, N + 5)))
+        assert len(index) == len(pending)
+
+def test_greedy_tour_visits_nearest_each_time():
+    rng = random.Random(1)
+    pending = {(rng.randint(1, 300), rng.randint(1, 300)) for _ in range(2000)}
+    index = DeliveryIndex(pending)
+    position = (1, 1)
+    while pending:
+        assert_nearest(index, pending, position)
+        position = index.nearest(position)
+        index.discard(position)
+        pending.discard(position)
+    assert index.nearest(position) is None
+
+def test_sparse_index_late_in_tour_uses_bucket_scan(monkeypatch):
+    # Discard nearly everything so the original bounds are mostly empty rings, then query from a corner.
+    points = [(x, y) for x in range(1, 201) for y in range(1, 201, 2)]
+    index = DeliveryIndex(points, bucket_size=2)
+    rng = random.Random(3)
+    remaining = set(rng.sample(points, 6))
+    for point in points:
+        if point not in remaining:
+            index.discard(point)
+
+    calls = []
+    scan = DeliveryIndex._nearest_in_buckets
+    monkeypatch.setattr(DeliveryIndex, "_nearest_in_buckets",
+                        lambda self, *args: calls.append(args) or scan(self, *args))
+    for query in [(1, 1), (200, 200), (1, 200), (100, 100), (-10, 50)]:
+        assert_nearest(index, remaining, query)
+    assert calls
+
+def test_duplicate_add_and_missing_discard_are_no_ops():
+    index = DeliveryIndex([(2, 2)], bucket_size=4)
+    index.add((2, 2))
+    index.discard((9, 9))
+    assert len(index) == 1
+    assert (2, 2) in index and (9, 9) not in index
+    index.discard((2, 2))
+    assert index.nearest((0, 0)) is None
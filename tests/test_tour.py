@@ -0,0 +1,54 @@
+import pickle
+import random
+
+import pytest
+
+from smart_delivery.environment import Environment
+from smart_delivery.planning import a_star_search
+from smart_delivery.tour import compile_map, order_tour, plan_tour, stitch_route
+
+
+def boxed_in_environment():
+    # (3, 3) is surrounded by obstacles, so it can never be reached.
+    obstacles = {(2, 3), (4, 3), (3, 2), (3, 4)}
+    return Environment(6, [(1, 3), (3, 3), (5, 5)], obstacles)
+
+def test_serial_and_parallel_plans_are_identical():
+    rng = random.Random(4)
+    N = 40
+    obstacles = {(rng.randint(1, N), rng.randint(1, N)) for _ in range(150)} - {(1, 1)}
+    points = {(rng.randint(1, N), rng.randint(1, N)) for _ in range(60)} - obstacles
+    compiled = compile_map(Environment(N, points, obstacles))
+    tour = order_tour((1, 1), points)
+    serial = plan_tour((1, 1), tour, compiled, workers=1)
+    assert serial == plan_tour((1, 1), tour, compiled, workers=2)
+    assert serial == plan_tour((1, 1), tour, compiled)
+
+def test_unreachable_stop_is_dropped_and_next_leg_replanned():
+    environment = boxed_in_environment()
+    compiled = compile_map(environment)
+    tour = [(1, 3), (3, 3), (5, 5)]
+    for workers in (1, 2):
+        paths, unreachable = plan_tour((1, 1), tour, compiled, workers=workers)
+        assert unreachable == [(3, 3)]
+        assert [(path[0], path[-1]) for path in paths] == [((1, 1), (1, 3)), ((1, 3), (5, 5))]
+        assert paths[1] == a_star_search((1, 3), (5, 5), compiled)
+
+def test_empty_tour():
+    assert plan_tour((1, 1), [], compile_map(Environment(3)), workers=4) == ([], [])
+
+def test_stitch_route_joins_legs_without_repeating_stops():
+    assert stitch_route([]) == []
+    assert stitch_route([[(1, 1), (1, 2)]]) == [(1, 1), (1, 2)]
+    assert stitch_route([[(1, 1), (1, 2)], [(1, 2), (2, 2), (3, 2)], [(3, 2), (3, 3)]]) == [
+        (1, 1), (1, 2), (2, 2), (3, 2), (3, 3)]
+
+def test_compiled_map_is_read_only_and_survives_pickling():
+    compiled = compile_map(Environment(4, [(1, 1)], {(2, 2)}, (), {(3, 3): "up"}))
+    with pytest.raises(TypeError):
+        compiled.one_way_streets[(1, 1)] = "down"
+    assert not compiled.delivery_points
+    copy = pickle.loads(pickle.dumps(compiled))
+    assert dict(copy.one_way_streets) == {(3, 3): "up"}
+    with pytest.raises(TypeError):
+        copy.one_way_streets[(1, 1)] = "down"